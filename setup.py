@@ -11,12 +11,16 @@ setup(
         "flask>=3.0.3",
         "matplotlib>=3.9.2",
         "numpy>=2.1.3",
+        "orjson>=3.10.0",
         "pandas>=2.2.3",
         "pillow>=11.0.0",
         "pydantic>=2.9.2",
         "strawberry-graphql>=0.248.1",
         "uvicorn>=0.32.0",
     ],
+    extras_require={
+        "accel": ["numba>=0.60"],
+    },
     entry_points={
         "console_scripts": [
             "taotrade=taotrade.cli:main",
@@ -37,35 +37,46 @@ def simulate(simulation_name):
         click.echo(f"\nStarting simulation: {simulation_id}")
         
         def monitor_progress():
+            last_key = None
             last_progress = None
             final_update_received = False
-            
+
             while not simulation_complete.is_set() or not final_update_received:
-                sim = engine.db.get_simulation_progress(simulation_id)
-                if not sim:
-                    break
-                
-                if sim['status'] == 'completed':
-                    progress = f"Progress: {sim['blocks']}/{sim['blocks']} (100.0%) ✅"
+                sim = engine._progress
+                status = sim['status']
+                total = sim['total']
+                current = min(sim['block'] + 1, total) if total else 0
+
+                # Skip formatting entirely when nothing changed since the
+                # last tick
+                key = (current, status)
+                if key == last_key:
+                    time.sleep(0.1)
+                    continue
+                last_key = key
+
+                if status == 'completed':
+                    progress = f"Progress: {total}/{total} (100.0%) ✅"
                     final_update_received = True
                 else:
-                    progress = f"Progress: {sim['progress']} ({sim['progress_percentage']:.1f}%)"
-                    if sim['status'] == 'running':
+                    percentage = (current / total * 100) if total else 0
+                    progress = f"Progress: {current}/{total} ({percentage:.1f}%)"
+                    if status == 'running':
                         progress += " ⏳"
-                    elif sim['status'] == 'interrupted':
+                    elif status == 'interrupted':
                         progress += " ⏹️"
-                    elif sim['status'] == 'failed':
+                    elif status == 'failed':
                         progress += " ❌"
-                
+
                 if progress != last_progress:
                     sys.stdout.write('\r' + ' ' * 80)
                     sys.stdout.write('\r' + progress)
                     sys.stdout.flush()
                     last_progress = progress
-                
-                if sim['status'] in ['interrupted', 'failed']:
+
+                if status in ['interrupted', 'failed']:
                     final_update_received = True
-                
+
                 time.sleep(0.1)
         
         progress_thread = threading.Thread(target=monitor_progress)
@@ -81,11 +92,13 @@ def simulate(simulation_name):
         
     except KeyboardInterrupt:
         if simulation_id:
+            engine._progress['status'] = 'interrupted'
             engine.db.update_simulation_status(simulation_id, 'interrupted')
             simulation_complete.set()
         click.echo("\nSimulation interrupted")
     except Exception as e:
         if simulation_id:
+            engine._progress['status'] = 'failed'
             engine.db.update_simulation_status(simulation_id, 'failed')
             simulation_complete.set()
         click.echo(f"\nSimulation failed: {str(e)}")
@@ -1,32 +1,95 @@
 from __future__ import annotations
 import sqlite3
-import json
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from taotrade.utils import unpack_id_amount_map
 import uuid
 
+# Connection settings tuned for the write-heavy simulation workload:
+# WAL + synchronous=NORMAL avoids an fsync per commit, the larger cache
+# and in-memory temp store keep the working set off disk, and mmap lets
+# reads bypass the page-cache copy.
+_CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=1073741824',
+    'PRAGMA wal_autocheckpoint=10000',
+)
+
+# Hot-path INSERT statements, held at module scope so every executemany
+# passes the identical string object and hits sqlite3's prepared-
+# statement cache instead of reparsing the SQL.
+_INSERT_ACCOUNT_SQL = """
+    INSERT INTO account_states
+    (simulation_id, block, account_id, free_balance,
+     market_value, alpha_stakes)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SUBNET_SQL = """
+    INSERT INTO subnet_states
+    (simulation_id, block, subnet_id, tao_in, alpha_in,
+     alpha_out, k, exchange_rate, emission_rate, dividends)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_NETWORK_SQL = """
+    INSERT INTO network_states
+    (simulation_id, block, tao_supply, sum_prices)
+    VALUES (?, ?, ?, ?)
+"""
+
 class Database:
     def __init__(self):
         self.db_path = Path('user_data/database.sqlite')
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.timeout = 30.0
+        self._write_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._read_conn: Optional[sqlite3.Connection] = None
         self._init_db()
 
     def _get_connection(self):
-        """Get database connection with proper settings"""
-        conn = sqlite3.connect(str(self.db_path), timeout=self.timeout)
-        conn.execute('PRAGMA journal_mode=WAL')
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared writer connection, creating it on first use"""
+        if self._conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.timeout,
+                check_same_thread=False,
+                cached_statements=256
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            conn.row_factory = sqlite3.Row
+            self._conn = conn
+        return self._conn
+
+    def _get_read_connection(self):
+        """Get the shared read-only connection, creating it on first use"""
+        if self._read_conn is None:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                timeout=self.timeout,
+                check_same_thread=False,
+                cached_statements=256
+            )
+            conn.row_factory = sqlite3.Row
+            self._read_conn = conn
+        return self._read_conn
 
     def _init_db(self) -> None:
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS simulations (
                     id TEXT PRIMARY KEY,
                     name TEXT NOT NULL,
-                    created_at TIMESTAMP NOT NULL,
+                    created_at REAL NOT NULL,
                     status TEXT NOT NULL,
                     blocks INTEGER,
                     tao_supply REAL,
@@ -41,7 +104,7 @@ class Database:
                     account_id INTEGER,
                     free_balance REAL,
                     market_value REAL,
-                    alpha_stakes JSON,
+                    alpha_stakes BLOB,
                     FOREIGN KEY (simulation_id) REFERENCES simulations(id),
                     PRIMARY KEY (simulation_id, block, account_id)
                 )
@@ -58,7 +121,7 @@ class Database:
                     k REAL,
                     exchange_rate REAL,
                     emission_rate REAL,
-                    dividends JSON,
+                    dividends BLOB,
                     FOREIGN KEY (simulation_id) REFERENCES simulations(id),
                     PRIMARY KEY (simulation_id, block, subnet_id)
                 )
@@ -76,34 +139,34 @@ class Database:
             """)
 
     def create_simulation(self, name: str) -> str:
-        simulation_id = str(uuid.uuid4())
-        with self._get_connection() as conn:
+        simulation_id = uuid.uuid4().hex
+        with self._write_lock, self._get_connection() as conn:
             conn.execute(
                 """
                 INSERT INTO simulations 
                 (id, name, created_at, status)
                 VALUES (?, ?, ?, ?)
                 """,
-                (simulation_id, name, datetime.utcnow(), 'created')
+                (simulation_id, name, time.time(), 'created')
             )
         return simulation_id
 
     def update_simulation_status(self, simulation_id: str, status: str) -> None:
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             conn.execute(
                 "UPDATE simulations SET status = ? WHERE id = ?",
                 (status, simulation_id)
             )
 
     def update_simulation_progress(self, simulation_id: str, current_block: int) -> None:
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             conn.execute(
                 "UPDATE simulations SET current_block = ? WHERE id = ?",
                 (current_block + 1, simulation_id)
             )
 
     def update_simulation_config(self, simulation_id: str, blocks: int, tao_supply: float) -> None:
-        with self._get_connection() as conn:
+        with self._write_lock, self._get_connection() as conn:
             conn.execute(
                 """
                 UPDATE simulations 
@@ -113,143 +176,157 @@ class Database:
                 (blocks, tao_supply, simulation_id)
             )
 
-    def store_simulation_state(self, simulation_id: str, block: int, 
-                             accounts: List[Dict], subnets: List[Dict], 
-                             network: Dict) -> None:
-        with self._get_connection() as conn:
-            conn.executemany(
-                """
-                INSERT INTO account_states 
-                (simulation_id, block, account_id, free_balance, 
-                 market_value, alpha_stakes)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                [(
-                    simulation_id,
-                    block,
-                    account['account_id'],
-                    account['free_balance'],
-                    account['market_value'],
-                    json.dumps(account['alpha_stakes'])
-                ) for account in accounts]
-            )
-            
-            conn.executemany(
-                """
-                INSERT INTO subnet_states 
-                (simulation_id, block, subnet_id, tao_in, alpha_in, 
-                 alpha_out, k, exchange_rate, emission_rate, dividends)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                [(
-                    simulation_id,
-                    block,
-                    subnet['subnet_id'],
-                    subnet['tao_in'],
-                    subnet['alpha_in'],
-                    subnet['alpha_out'],
-                    subnet['k'],
-                    subnet['exchange_rate'],
-                    subnet['emission_rate'],
-                    json.dumps(subnet['dividends'])
-                ) for subnet in subnets]
-            )
-            
-            conn.execute(
-                """
-                INSERT INTO network_states 
-                (simulation_id, block, tao_supply, sum_prices)
-                VALUES (?, ?, ?, ?)
-                """,
-                (simulation_id, block, network['tao_supply'], network['sum_prices'])
-            )
+    @staticmethod
+    def _format_created_at(created_at) -> str:
+        """Format a stored epoch timestamp as an ISO-8601 string"""
+        if isinstance(created_at, (int, float)):
+            return datetime.utcfromtimestamp(created_at).isoformat()
+        # Rows written before created_at was stored as epoch seconds
+        return str(created_at)
+
+    def build_state_rows(self, simulation_id: str,
+                        state: Dict[str, Any]) -> Dict[str, List[tuple]]:
+        """Build insert rows from a column-oriented state snapshot"""
+        block = state['block']
+        accounts = state['accounts']
+        subnets = state['subnets']
+        network = state['network']
+        return {
+            'account_states': [
+                (simulation_id, block, account_id, free_balance, market_value, stakes)
+                for account_id, free_balance, market_value, stakes in zip(
+                    accounts['account_id'].tolist(),
+                    accounts['free_balance'].tolist(),
+                    accounts['market_value'].tolist(),
+                    accounts['alpha_stakes']
+                )
+            ],
+            'subnet_states': [
+                (simulation_id, block) + row
+                for row in zip(
+                    subnets['subnet_id'].tolist(),
+                    subnets['tao_in'].tolist(),
+                    subnets['alpha_in'].tolist(),
+                    subnets['alpha_out'].tolist(),
+                    subnets['k'].tolist(),
+                    subnets['exchange_rate'].tolist(),
+                    subnets['emission_rate'].tolist(),
+                    subnets['dividends']
+                )
+            ],
+            'network_states': [(
+                simulation_id, block, network['tao_supply'], network['sum_prices']
+            )]
+        }
+
+    def store_simulation_state_batch(self, simulation_id: str,
+                                   rows_by_table: Dict[str, List[tuple]],
+                                   current_block: Optional[int] = None) -> None:
+        """Store state rows for multiple blocks in a single transaction"""
+        with self._write_lock, self._get_connection() as conn:
+            conn.execute("BEGIN")
+            if current_block is not None:
+                conn.execute(
+                    "UPDATE simulations SET current_block = ? WHERE id = ?",
+                    (current_block, simulation_id)
+                )
+            conn.executemany(_INSERT_ACCOUNT_SQL, rows_by_table.get('account_states', []))
+            conn.executemany(_INSERT_SUBNET_SQL, rows_by_table.get('subnet_states', []))
+            conn.executemany(_INSERT_NETWORK_SQL, rows_by_table.get('network_states', []))
+            conn.execute("COMMIT")
 
     def get_simulation_progress(self, simulation_id: str) -> Optional[Dict[str, Any]]:
-        with self._get_connection() as conn:
-            sim = conn.execute(
-                """
-                SELECT id, status, blocks, current_block
-                FROM simulations 
-                WHERE id = ?
-                """,
-                (simulation_id,)
-            ).fetchone()
-            
-            if not sim:
-                return None
-            
-            current_block = min(sim['current_block'], sim['blocks']) if sim['blocks'] else 0
-            total_blocks = sim['blocks'] if sim['blocks'] else 0
-            
-            return {
-                'id': sim['id'],
-                'status': sim['status'],
-                'blocks': sim['blocks'],
-                'current_block': current_block,
-                'progress': f"{current_block}/{total_blocks}",
-                'progress_percentage': (current_block / total_blocks * 100) if total_blocks else 0
-            }
+        conn = self._get_read_connection()
+        sim = conn.execute(
+            """
+            SELECT id, status, blocks, current_block
+            FROM simulations
+            WHERE id = ?
+            """,
+            (simulation_id,)
+        ).fetchone()
+
+        if not sim:
+            return None
+
+        current_block = min(sim['current_block'], sim['blocks']) if sim['blocks'] else 0
+        total_blocks = sim['blocks'] if sim['blocks'] else 0
+
+        return {
+            'id': sim['id'],
+            'status': sim['status'],
+            'blocks': sim['blocks'],
+            'current_block': current_block,
+            'progress': f"{current_block}/{total_blocks}",
+            'progress_percentage': (current_block / total_blocks * 100) if total_blocks else 0
+        }
 
     def get_simulation(self, simulation_id: str) -> Optional[Dict[str, Any]]:
-        with self._get_connection() as conn:
-            sim = conn.execute(
-                "SELECT * FROM simulations WHERE id = ?",
-                (simulation_id,)
-            ).fetchone()
-            
-            if not sim:
-                return None
-            
-            blocks_with_data = self._get_blocks_with_data(conn, simulation_id)
-            
-            blocks = {}
-            for block in blocks_with_data:
-                blocks[block['block']] = self._get_block_state(conn, simulation_id, block['block'])
-            
-            return {
-                'id': sim['id'],
-                'name': sim['name'],
-                'created_at': sim['created_at'],
-                'status': sim['status'],
-                'blocks': blocks,
-                'metadata': {
-                    'total_blocks': sim['blocks'],
-                    'logged_blocks': len(blocks),
-                    'log_interval': sim['blocks'] // len(blocks) if blocks else None
-                }
+        conn = self._get_read_connection()
+        sim = conn.execute(
+            "SELECT * FROM simulations WHERE id = ?",
+            (simulation_id,)
+        ).fetchone()
+
+        if not sim:
+            return None
+
+        blocks = self._get_simulation_blocks(conn, [simulation_id])[simulation_id]
+
+        return {
+            'id': sim['id'],
+            'name': sim['name'],
+            'created_at': self._format_created_at(sim['created_at']),
+            'status': sim['status'],
+            'blocks': blocks,
+            'metadata': {
+                'total_blocks': sim['blocks'],
+                'logged_blocks': len(blocks),
+                'log_interval': sim['blocks'] // len(blocks) if blocks else None
             }
+        }
+
+    def _get_simulation_blocks(self, conn: sqlite3.Connection,
+                              simulation_ids: List[str]) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """
+        Load all logged block states for the given simulations.
 
-    def _get_blocks_with_data(self, conn: sqlite3.Connection, 
-                             simulation_id: str) -> List[sqlite3.Row]:
-        return conn.execute("""
-            SELECT DISTINCT block 
-            FROM (
-                SELECT block FROM account_states WHERE simulation_id = ?
-                UNION
-                SELECT block FROM subnet_states WHERE simulation_id = ?
-                UNION
-                SELECT block FROM network_states WHERE simulation_id = ?
+        Pulls each state table in a single ordered range scan and groups
+        rows by (simulation, block) in one Python pass, instead of issuing
+        three queries per logged block.
+        """
+        placeholders = ','.join('?' * len(simulation_ids))
+        blocks: Dict[str, Dict[int, Dict[str, Any]]] = {sid: {} for sid in simulation_ids}
+
+        def block_state(simulation_id: str, block: int) -> Dict[str, Any]:
+            return blocks[simulation_id].setdefault(
+                block, {'accounts': [], 'subnets': [], 'network': None}
             )
-            ORDER BY block
-        """, (simulation_id, simulation_id, simulation_id)).fetchall()
 
-    def _get_block_state(self, conn: sqlite3.Connection, 
-                        simulation_id: str, block: int) -> Dict[str, Any]:
-        accounts = [
-            {
+        for state in conn.execute(
+            f"""
+            SELECT * FROM account_states
+            WHERE simulation_id IN ({placeholders})
+            ORDER BY block, account_id
+            """,
+            simulation_ids
+        ):
+            block_state(state['simulation_id'], state['block'])['accounts'].append({
                 'account_id': state['account_id'],
                 'free_balance': state['free_balance'],
                 'market_value': state['market_value'],
-                'alpha_stakes': json.loads(state['alpha_stakes'])
-            }
-            for state in conn.execute(
-                "SELECT * FROM account_states WHERE simulation_id = ? AND block = ?",
-                (simulation_id, block)
-            ).fetchall()
-        ]
-        
-        subnets = [
-            {
+                'alpha_stakes': unpack_id_amount_map(state['alpha_stakes'])
+            })
+
+        for state in conn.execute(
+            f"""
+            SELECT * FROM subnet_states
+            WHERE simulation_id IN ({placeholders})
+            ORDER BY block, subnet_id
+            """,
+            simulation_ids
+        ):
+            block_state(state['simulation_id'], state['block'])['subnets'].append({
                 'subnet_id': state['subnet_id'],
                 'tao_in': state['tao_in'],
                 'alpha_in': state['alpha_in'],
@@ -257,85 +334,79 @@ class Database:
                 'k': state['k'],
                 'exchange_rate': state['exchange_rate'],
                 'emission_rate': state['emission_rate'],
-                'dividends': json.loads(state['dividends'])
+                'dividends': unpack_id_amount_map(state['dividends'])
+            })
+
+        for state in conn.execute(
+            f"""
+            SELECT * FROM network_states
+            WHERE simulation_id IN ({placeholders})
+            ORDER BY block
+            """,
+            simulation_ids
+        ):
+            block_state(state['simulation_id'], state['block'])['network'] = {
+                'tao_supply': state['tao_supply'],
+                'sum_prices': state['sum_prices']
             }
-            for state in conn.execute(
-                "SELECT * FROM subnet_states WHERE simulation_id = ? AND block = ?",
-                (simulation_id, block)
-            ).fetchall()
-        ]
-        
-        network = conn.execute(
-            "SELECT * FROM network_states WHERE simulation_id = ? AND block = ?",
-            (simulation_id, block)
-        ).fetchone()
-        
-        return {
-            'accounts': accounts,
-            'subnets': subnets,
-            'network': {
-                'tao_supply': network['tao_supply'],
-                'sum_prices': network['sum_prices']
-            } if network else None
-        }
+
+        return blocks
 
     def get_simulations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get list of simulations with their complete data"""
-        with self._get_connection() as conn:
-            sims = conn.execute(
-                "SELECT * FROM simulations ORDER BY created_at DESC LIMIT ?",
-                (limit,)
-            ).fetchall()
-            
-            if not sims:
-                return []
-            
-            results = []
-            for sim in sims:
-                blocks_with_data = self._get_blocks_with_data(conn, sim['id'])
-                
-                blocks = {}
-                for block in blocks_with_data:
-                    blocks[block['block']] = self._get_block_state(conn, sim['id'], block['block'])
-                
-                simulation = {
-                    'id': sim['id'],
-                    'name': sim['name'],
-                    'created_at': sim['created_at'],
-                    'status': sim['status'],
-                    'blocks': blocks,
-                    'metadata': {
-                        'total_blocks': sim['blocks'],
-                        'logged_blocks': len(blocks),
-                        'log_interval': sim['blocks'] // len(blocks) if blocks else None
-                    }
-                }
-                results.append(simulation)
-            
-            return results
+        conn = self._get_read_connection()
+        sims = conn.execute(
+            "SELECT * FROM simulations ORDER BY created_at DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
 
-    def get_simulations_without_blocks(self, limit: int = 10) -> List[Dict[str, Any]]:
-        with self._get_connection() as conn:
-            sims = conn.execute(
-                """
-                SELECT id, name, created_at, status, blocks, current_block
-                FROM simulations 
-                ORDER BY created_at DESC 
-                LIMIT ?
-                """,
-                (limit,)
-            ).fetchall()
-            
-            if not sims:
-                return []
-            
-            return [{
+        if not sims:
+            return []
+
+        all_blocks = self._get_simulation_blocks(conn, [sim['id'] for sim in sims])
+
+        results = []
+        for sim in sims:
+            blocks = all_blocks[sim['id']]
+
+            simulation = {
                 'id': sim['id'],
                 'name': sim['name'],
-                'created_at': sim['created_at'],
+                'created_at': self._format_created_at(sim['created_at']),
                 'status': sim['status'],
+                'blocks': blocks,
                 'metadata': {
                     'total_blocks': sim['blocks'],
-                    'progression': f"{sim['current_block']}/{sim['blocks']}" if sim['blocks'] else "0/0",
+                    'logged_blocks': len(blocks),
+                    'log_interval': sim['blocks'] // len(blocks) if blocks else None
                 }
-            } for sim in sims]
+            }
+            results.append(simulation)
+
+        return results
+
+    def get_simulations_without_blocks(self, limit: int = 10) -> List[Dict[str, Any]]:
+        conn = self._get_read_connection()
+        sims = conn.execute(
+            """
+            SELECT id, name, created_at, status, blocks, current_block
+            FROM simulations
+            ORDER BY created_at DESC
+            LIMIT ?
+            """,
+            (limit,)
+        ).fetchall()
+
+        if not sims:
+            return []
+
+        return [{
+            'id': sim['id'],
+            'name': sim['name'],
+            'created_at': self._format_created_at(sim['created_at']),
+            'status': sim['status'],
+            'metadata': {
+                'total_blocks': sim['blocks'],
+                'progression': f"{sim['current_block']}/{sim['blocks']}" if sim['blocks'] else "0/0",
+            }
+        } for sim in sims]
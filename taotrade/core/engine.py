@@ -1,21 +1,37 @@
 import importlib.util
+import queue
 import sys
+import threading
 from pathlib import Path
-from typing import Type, cast
+from typing import Dict, List, Tuple, Type, cast
 from taotrade.models.base.simulation import BaseSimulation
 from taotrade.models.subtensor import Subtensor
 from taotrade.core.database import Database
 
 class SimulationEngine:
+    FLUSH_BLOCKS = 64
+
+    # Loaded simulation classes keyed by name, invalidated when the
+    # source file's mtime changes
+    _class_cache: Dict[str, Tuple[float, Type[BaseSimulation]]] = {}
+
     def __init__(self):
         self.db = Database()
+        # Monitoring view of the most recent run (see run_simulation);
+        # all per-run mutable state lives in run_simulation locals
+        self._progress = {'block': 0, 'total': 0, 'status': 'created'}
 
     def _load_simulation_class(self, simulation_name: str) -> Type[BaseSimulation]:
-        """Load simulation class from file"""
+        """Load simulation class from file, reusing it while the file is unchanged"""
         file_path = Path(f'user_data/simulations/{simulation_name}.py')
         if not file_path.exists():
             raise ValueError(f"Simulation {simulation_name} not found at {file_path}")
 
+        mtime = file_path.stat().st_mtime
+        cached = self._class_cache.get(simulation_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         spec = importlib.util.spec_from_file_location(simulation_name, file_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Could not load simulation module: {simulation_name}")
@@ -31,41 +47,66 @@ class SimulationEngine:
         simulation_class = getattr(module, class_name)
         if not issubclass(simulation_class, BaseSimulation):
             raise ValueError(f"Class {class_name} must inherit from BaseSimulation")
-        
+
+        self._class_cache[simulation_name] = (mtime, simulation_class)
         return simulation_class
 
-    def _update_progress(self, simulation_id: str, block: int, total_blocks: int, log_interval: int) -> None:
-        """Update simulation progress based on log interval"""
-        if block == 0 or block == total_blocks - 1 or block % log_interval == 0:
-            self.db.update_simulation_progress(simulation_id, block)
+    def _flush_state_buffer(self, simulation_id: str,
+                            state_buffer: List[Dict[str, List[tuple]]],
+                            progress: Dict) -> None:
+        """Write buffered block states and progress in one transaction"""
+        if not state_buffer:
+            return
+        rows_by_table: Dict[str, List[tuple]] = {}
+        for block_rows in state_buffer:
+            for table, rows in block_rows.items():
+                rows_by_table.setdefault(table, []).extend(rows)
+        self.db.store_simulation_state_batch(
+            simulation_id,
+            rows_by_table,
+            current_block=progress['block'] + 1
+        )
+        state_buffer.clear()
 
-    def _process_block(self, subtensor: Subtensor, block: int, simulation_id: str) -> None:
-        """Process a single block in the simulation"""
-        
-        if block in subtensor.transaction_blocks:
-            for tx in subtensor.transaction_blocks[block]:
-                subtensor._execute_transaction(tx)
+    def _writer_loop(self, write_queue: queue.Queue, simulation_id: str,
+                     progress: Dict, errors: List[Exception]) -> None:
+        """
+        Drain queued state rows and write them in FLUSH_BLOCKS-sized batches.
 
-        if block != 0:
-            subtensor._process_block_step()
-        
-        self._update_progress(simulation_id, block, subtensor.blocks, subtensor.log_interval)
-        
-        if block % subtensor.log_interval == 0 or block == subtensor.blocks - 1:
-            state = subtensor.get_state(block)
-            self.db.store_simulation_state(
-                simulation_id,
-                block,
-                state['accounts'],
-                state['subnets'],
-                state['network']
-            )
+        Runs on a dedicated thread so SQLite commits overlap with the next
+        blocks of simulation compute (the GIL is released inside sqlite3's
+        C calls). A None item signals end of run and flushes the remainder.
+
+        The buffer is local and the progress dict and error slot belong to
+        the calling run_simulation, so concurrent runs on one engine never
+        share writer state.
+        """
+        state_buffer: List[Dict[str, List[tuple]]] = []
+        while True:
+            item = write_queue.get()
+            if item is None:
+                break
+            if errors:
+                # Keep draining so the producer never blocks on a full queue
+                continue
+            state_buffer.append(item)
+            if len(state_buffer) >= self.FLUSH_BLOCKS:
+                try:
+                    self._flush_state_buffer(simulation_id, state_buffer, progress)
+                except Exception as e:
+                    errors.append(e)
+        if not errors:
+            try:
+                self._flush_state_buffer(simulation_id, state_buffer, progress)
+            except Exception as e:
+                errors.append(e)
 
     def run_simulation(self, simulation_name: str, simulation_id: str = None) -> str:
         """Run a simulation"""
         if simulation_id is None:
             simulation_id = self.db.create_simulation(simulation_name)
-        
+
+        progress = self._progress
         try:
             simulation = self._load_simulation_class(simulation_name)()
             simulation.id = simulation_id
@@ -79,15 +120,62 @@ class SimulationEngine:
                 subtensor.blocks,
                 subtensor.tao_supply
             )
+            # Per-run mutable state stays in locals handed to the writer
+            # thread, so overlapping runs on one engine never share a
+            # buffer, progress dict or error slot; self._progress is only
+            # rebound as a monitoring view of the latest run
+            progress = {'block': 0, 'total': subtensor.blocks, 'status': 'running'}
+            self._progress = progress
+            writer_errors: List[Exception] = []
             self.db.update_simulation_status(simulation_id, 'running')
-            
-            for block in range(subtensor.blocks):
-                self._process_block(subtensor, block, simulation_id)
+
+            # Hoist everything the per-block loop touches into locals;
+            # attribute lookups add up over millions of iterations.
+            total = subtensor.blocks
+            log_interval = subtensor.log_interval
+            transactions_at = subtensor.transactions_at
+            execute_transactions = subtensor._execute_transactions
+            process_block_step = subtensor._process_block_step
+            get_state_columns = subtensor.get_state_columns
+            build_state_rows = self.db.build_state_rows
+
+            write_queue: queue.Queue = queue.Queue(maxsize=self.FLUSH_BLOCKS * 4)
+            writer = threading.Thread(
+                target=self._writer_loop,
+                args=(write_queue, simulation_id, progress, writer_errors),
+                daemon=True
+            )
+            writer.start()
+
+            try:
+                for block in range(total):
+                    span = transactions_at(block)
+                    if span:
+                        execute_transactions(*span)
+
+                    if block != 0:
+                        process_block_step()
+
+                    progress['block'] = block
+
+                    if block % log_interval == 0 or block == total - 1:
+                        write_queue.put(build_state_rows(
+                            simulation_id,
+                            get_state_columns(block)
+                        ))
+            finally:
+                write_queue.put(None)
+                writer.join()
+
+            if writer_errors:
+                raise writer_errors[0]
 
             self.db.update_simulation_progress(simulation_id, subtensor.blocks - 1)
+            progress['status'] = 'completed'
             self.db.update_simulation_status(simulation_id, 'completed')
             return simulation_id
-            
+
         except Exception as e:
+            progress['status'] = 'failed'
             self.db.update_simulation_status(simulation_id, 'failed')
             raise e
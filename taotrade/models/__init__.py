@@ -3,7 +3,7 @@ from .base.strategy import Strategy
 from .base.simulation import BaseSimulation
 from .account import Account
 from .subnet import Subnet
-from .transaction import Transaction
+from .transaction import Action, Transaction
 from .subtensor import Subtensor
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     'Strategy',
     'BaseSimulation',
     'Account',
+    'Action',
     'Subnet',
     'Transaction',
     'Subtensor'
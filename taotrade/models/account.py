@@ -1,10 +1,16 @@
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
-from .subnet import Subnet
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from .base.types import AccountConfig
 from .base.strategy import Strategy
 
-@dataclass
+# Shared immutable default for alpha_stakes: most configs start with no
+# stakes, so every such account aliases this one proxy instead of
+# allocating an empty dict apiece. Subtensor rebinds the field to real
+# storage (a stake-matrix row) at construction, so it is never written.
+_NO_STAKES = MappingProxyType({})
+
+@dataclass(slots=True)
 class Account:
     """
     Class representing a user account with balance and subnet stakes.
@@ -13,13 +19,27 @@ class Account:
         id (int): Unique identifier for the account
         free_balance (float): Available tao balance in the account
         registered_subnets (List[int]): List of subnet IDs the account is registered with
-        alpha_stakes (Dict[int, float]): Mapping of subnet IDs to staked alpha amounts
+        alpha_stakes (Mapping[int, float]): Mapping of subnet IDs to staked alpha
+            amounts; defaults to a shared read-only empty mapping. Subtensor
+            converts this to a fixed-size float64 array (one slot per subnet
+            column) when the simulation is constructed, so hot-path code
+            indexes positions instead of hashing subnet IDs.
+        registered_mask (int): Bitmask form of registered_subnets (bit s set
+            when registered with subnet s); registration tests are single
+            bit probes instead of list scans
     """
     id: int
     free_balance: float
     registered_subnets: List[int]
-    alpha_stakes: Dict[int, float]
+    # default_factory because dataclasses reject the proxy as a plain
+    # default; the factory still hands out the single shared instance
+    alpha_stakes: Mapping[int, float] = field(default_factory=lambda: _NO_STAKES)
     strategy: Optional[Strategy] = None
+    registered_mask: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Fold the registered subnet list into a bitmask once at load time"""
+        self.registered_mask = sum(1 << s for s in self.registered_subnets)
 
     @classmethod
     def from_config(cls, config: AccountConfig, strategy: Optional[Strategy] = None):
@@ -30,25 +50,3 @@ class Account:
             alpha_stakes=config.alpha_stakes,
             strategy=strategy
         )
-
-    def calculate_market_value(self, subnets: Dict[int, 'Subnet']) -> float:
-        """Calculate total market value of account including stakes"""
-        return (
-            self.free_balance +
-            sum(
-                self.alpha_stakes.get(subnet.id, 0.0) if subnet.is_root
-                else (subnet.tao_in - (subnet.k / (subnet.alpha_in + 
-                      self.alpha_stakes.get(subnet.id, 0.0))))
-                for subnet in subnets.values()
-                if self.alpha_stakes.get(subnet.id, 0.0) > 0
-            )
-        )
-
-    def get_state(self, subnets: Dict[int, 'Subnet']) -> Dict[str, Any]:
-        """Get account state including market value"""
-        return {
-            'account_id': self.id,
-            'free_balance': self.free_balance,
-            'market_value': self.calculate_market_value(subnets),
-            'alpha_stakes': self.alpha_stakes.copy()
-        }
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
-@dataclass
+@dataclass(slots=True)
 class Subnet:
     """
     Class representing a subnet in the network.
@@ -43,7 +43,8 @@ class Subnet:
         Returns:
             float: Alpha price in tao
         """
-        return 1.0 if self.is_root or self.alpha_in == 0 else self.tao_in / self.alpha_in
+        alpha_in = self.alpha_in
+        return 1.0 if self.is_root or alpha_in == 0 else self.tao_in / alpha_in
 
     def weight(self, alpha_amount: float) -> float:
         """
@@ -60,9 +61,10 @@ class Subnet:
         Returns:
             float: Voting weight
         """
-        return alpha_amount if self.is_root else (
-            0.0 if self.alpha_out == 0 else (alpha_amount / self.alpha_out) * self.tao_in
-        )
+        if self.is_root:
+            return alpha_amount
+        alpha_out = self.alpha_out
+        return 0.0 if alpha_out == 0 else (alpha_amount / alpha_out) * self.tao_in
 
     def stake(self, tao_amount: float) -> float:
         """
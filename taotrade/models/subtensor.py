@@ -1,6 +1,89 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from collections import defaultdict
-from .transaction import Transaction
+import numpy as np
+from taotrade.utils import pack_id_amount_map
+from .transaction import AMOUNT_ALL, AMOUNT_PCT, Action, Transaction
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in when numba is not installed"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True, fastmath=True)
+def _step_kernel(stakes: np.ndarray, tao_in: np.ndarray, alpha_in: np.ndarray,
+                 alpha_out: np.ndarray, k: np.ndarray, registered: np.ndarray,
+                 is_root: np.ndarray, root_weight: float, global_split: float,
+                 balanced: bool, emission_val: float) -> float:
+    """
+    Advance every subnet pool and stake balance by one block, in place.
+
+    Mirrors _process_block_step's math on the SoA arrays so numba can
+    compile the whole step when installed; without numba it runs as plain
+    vectorized NumPy. Boolean masks are folded in as multiplies rather
+    than fancy indexing to keep the body numba-compatible.
+
+    Returns:
+        float: Tao supply delta for the block
+    """
+    non_root = ~is_root
+    alpha_in_safe = np.where(alpha_in > 0, alpha_in, 1.0)
+    prices = np.where(alpha_in > 0, tao_in / alpha_in_safe, 1.0)
+    sum_prices = (prices * non_root).sum()
+
+    tao_total = (tao_in * non_root).sum()
+    shares = (tao_in / tao_total if tao_total > 0 else tao_in * 0.0) * non_root
+
+    alpha_out_safe = np.where(alpha_out > 0, alpha_out, 1.0)
+    price_w = (tao_in / alpha_out_safe) * (alpha_out > 0)
+    per_unit = np.where(is_root, root_weight, price_w)
+
+    global_w = stakes @ per_unit
+    total_global = global_w.sum()
+    global_share = global_w / total_global if total_global > 0 else global_w * 0.0
+
+    local_w = stakes * price_w
+    local_tot = local_w.sum(axis=0)
+    local_tot_safe = np.where(local_tot > 0, local_tot, 1.0)
+    local_share = (local_w / local_tot_safe) * (local_tot > 0)
+
+    div = (global_split * global_share.reshape(-1, 1) +
+           (1.0 - global_split) * local_share) * non_root
+    stakes += div * registered * emission_val
+
+    # Branches folded into factors: injections run unconditionally as
+    # multiplies, zeroed out when the condition doesn't hold
+    tao_factor = emission_val if sum_prices < 1.0 or not balanced else 0.0
+    alpha_factor = emission_val if sum_prices >= 1.0 and balanced else 0.0
+    tao_in += shares * tao_factor
+    alpha_in += non_root * alpha_factor
+    alpha_out += non_root * emission_val
+    k[:] = np.where(non_root, tao_in * alpha_in, k)
+
+    return tao_factor
+
+
+@njit(cache=True, fastmath=True)
+def _market_value_kernel(stakes: np.ndarray, tao_in: np.ndarray,
+                         alpha_in: np.ndarray, k: np.ndarray,
+                         is_root: np.ndarray,
+                         free_balance: np.ndarray) -> np.ndarray:
+    """
+    Numeric kernel for per-account market value.
+
+    Pure array math kept at module level so numba can JIT-compile it when
+    installed; without numba it runs as plain vectorized NumPy.
+    """
+    contrib = np.where(is_root, stakes, tao_in - k / (alpha_in + stakes))
+    contrib = np.where(stakes > 0, contrib, 0.0)
+    return free_balance + contrib.sum(axis=1)
+
 
 class Subtensor:
     """
@@ -11,7 +94,10 @@ class Subtensor:
     Attributes:
         subnets: Dict[int, Subnet] mapping subnet IDs to Subnet objects
         accounts: Dict[int, Account] mapping account IDs to Account objects
-        transaction_blocks: Dict[int, List[Transaction]] mapping blocks to transactions
+        stakes: (n_accounts, n_subnets) float64 matrix of alpha stakes; each
+            account's alpha_stakes is a view of its row
+        transaction_blocks: Dict[int, List[Transaction]] mapping blocks to
+            their transactions, in input order
         tao_supply: Total TAO token supply
         global_split: Ratio (0-1) between global/local rewards
         balanced: If True, uses balanced emission mode
@@ -25,6 +111,7 @@ class Subtensor:
                  injection_range=(0.0, 1.0)):
         self.subnets = {s.id: s for s in subnets}
         self.accounts = {a.id: a for a in accounts}
+        self._init_stake_arrays()
         self.transaction_blocks = self._organize_transactions(transactions)
         self.tao_supply = tao_supply
         self.global_split = global_split
@@ -32,45 +119,165 @@ class Subtensor:
         self.initial_root_weight = root_weight
         self.root_weight = root_weight
         self.blocks = blocks
+        self._init_transaction_arrays()
         self.log_interval = int(blocks/n_steps)
         self.injection_range = injection_range
+        # Deterministic decay schedule, precomputed so per-block updates
+        # are a single array index
+        self._root_weights = np.maximum(
+            0.0,
+            self.initial_root_weight *
+            (1.0 - np.arange(blocks, dtype=np.float64) / blocks)
+        )
+
+    def _init_stake_arrays(self):
+        """
+        Replace each account's alpha_stakes dict with a fixed-size array.
+
+        Subnet IDs are mapped to contiguous columns (sorted order) and all
+        stakes live in one (n_accounts, n_subnets) float64 matrix; each
+        account's alpha_stakes is a view of its row, so per-account updates
+        and whole-matrix math share the same storage. The dict form only
+        exists at config time and at the serialization boundary (see
+        _stakes_to_dict).
+        """
+        self._col_to_sid = np.array(sorted(self.subnets), dtype=np.int64)
+        self._sid_to_col = {int(sid): col for col, sid in enumerate(self._col_to_sid)}
+        self._account_ids = np.array(list(self.accounts), dtype=np.int64)
+        self._account_id_list = list(self.accounts)
+        self._acc_index = {int(aid): row for row, aid in enumerate(self._account_ids)}
+        self._accounts_by_row = list(self.accounts.values())
+        self._subnets_by_col = [self.subnets[int(sid)] for sid in self._col_to_sid]
+        self._is_root_mask = np.array(
+            [s.is_root for s in self._subnets_by_col], dtype=bool
+        )
+        # Pool state lives in these arrays for the whole run; the step
+        # kernel and the transaction executor read and write them directly,
+        # and the Subnet objects are only materialized again at snapshot
+        # time (_sync_pools_to_subnets)
+        self._pool_tao_in = np.array(
+            [s.tao_in for s in self._subnets_by_col], dtype=np.float64
+        )
+        self._pool_alpha_in = np.array(
+            [s.alpha_in for s in self._subnets_by_col], dtype=np.float64
+        )
+        self._pool_alpha_out = np.array(
+            [s.alpha_out for s in self._subnets_by_col], dtype=np.float64
+        )
+        self._pool_k = np.array(
+            [s.k for s in self._subnets_by_col], dtype=np.float64
+        )
+        self.stakes = np.zeros((len(self._account_ids), len(self._col_to_sid)),
+                               dtype=np.float64)
+        # 0.0/1.0 rather than bool: the step kernel folds registration in
+        # as a multiply, and a float mask skips the bool->float conversion
+        # that would otherwise happen every block
+        self._registered = np.zeros(self.stakes.shape, dtype=np.float64)
+        # Vectors and aggregates derived from subnet pool state are cached
+        # until a transaction or block step mutates the pools
+        self._pools_dirty = True
+        self._wpu_vec = np.zeros(len(self._col_to_sid), dtype=np.float64)
+        self._tao_in_vec = np.zeros(len(self._col_to_sid), dtype=np.float64)
+        self._sum_prices = 0.0
+        self._tao_in_total = 0.0
+        # Snapshot column buffers, allocated on first use and reused
+        self._snapshot_bufs = None
+        for row, account in enumerate(self.accounts.values()):
+            for sid, amount in account.alpha_stakes.items():
+                self.stakes[row, self._sid_to_col[sid]] = amount
+            # Registration tests against the account's bitmask; unknown
+            # subnet ids simply have no bit set
+            mask = account.registered_mask
+            for col, sid in enumerate(self._col_to_sid):
+                if mask & (1 << int(sid)):
+                    self._registered[row, col] = 1.0
+            account.alpha_stakes = self.stakes[row]
+
+    def _stakes_to_dict(self, stakes: np.ndarray) -> Dict[int, float]:
+        """Convert a stake array back to {subnet_id: amount}, nonzero entries only"""
+        cols = np.nonzero(stakes)[0]
+        return {int(self._col_to_sid[c]): float(stakes[c]) for c in cols}
 
     def _organize_transactions(self, transactions: List[Transaction]) -> Dict[int, List[Transaction]]:
         """
-        Organize transactions by block number for efficient processing.
+        Organize transactions by block number.
+
+        Input order is preserved within each block: relative amounts
+        ('all', percentages) resolve against balances left by earlier
+        transactions, so execution order is part of the semantics.
 
         Args:
             transactions (List[Transaction]): List of transactions to organize
 
         Returns:
-            Dict[int, List[Transaction]]: Mapping of block numbers to lists of transactions
+            Dict[int, List[Transaction]]: Mapping of block numbers to
+                transactions, in input order within each block
         """
         transaction_dict = defaultdict(list)
         for transaction in transactions:
             transaction_dict[transaction.block].append(transaction)
         return dict(transaction_dict)
 
-    def _parse_amount(self, amount: str, total: float) -> float:
+    def _init_transaction_arrays(self):
+        """
+        Flatten the bucketed transactions into parallel arrays (SoA).
+
+        The Transaction objects only exist at config time; execution reads
+        these arrays instead, with account rows, subnet columns, action
+        tags and pre-parsed amounts all resolved up front. Entries are
+        laid out in execution order (ascending block, input order within
+        a block). Unknown accounts, subnets or action tags get sentinel
+        values and are skipped by the executor, as the object path
+        skipped them.
+
+        A CSR-style offsets index over the block column gives each block
+        its slice in O(1): _tx_offsets[b] .. _tx_offsets[b + 1]. The
+        flattening iterates blocks in sorted order, so the block column is
+        already sorted and a single searchsorted builds the whole index.
+        """
+        flat = []
+        blocks = []
+        for block in sorted(self.transaction_blocks):
+            transactions = self.transaction_blocks[block]
+            flat.extend(transactions)
+            blocks.extend([block] * len(transactions))
+        self._tx_block = np.array(blocks, dtype=np.int64)
+        self._tx_offsets = np.searchsorted(
+            self._tx_block, np.arange(self.blocks + 1, dtype=np.int64)
+        )
+        self._tx_row = np.array(
+            [self._acc_index.get(t.account_id, -1) for t in flat], dtype=np.int64
+        )
+        self._tx_col = np.array(
+            [self._sid_to_col.get(t.subnet_id, -1) for t in flat], dtype=np.int64
+        )
+        self._tx_action = np.array(
+            [int(t.action) if isinstance(t.action, int) else 0 for t in flat],
+            dtype=np.int64
+        )
+        self._tx_kind = np.array([t._kind for t in flat], dtype=np.int64)
+        self._tx_val = np.array([t._val for t in flat], dtype=np.float64)
+
+    def transactions_at(self, block: int) -> Optional[tuple]:
         """
-        Parse amount string into a float value.
+        Return the block's [start, stop) slice of the transaction arrays,
+        or None if it has none.
 
-        Supports formats:
-            - 'all': Returns total amount
-            - '50%': Returns 50% of total
-            - '123': Returns float value 123.0
+        A pair of reads against the precomputed CSR offsets, so lookups
+        are O(1) for any block in any order.
 
         Args:
-            amount (str): Amount string to parse
-            total (float): Total available amount for percentage calculations
+            block (int): Block number to look up
 
         Returns:
-            float: Parsed amount value
+            Optional[tuple]: (start, stop) into the transaction arrays,
+                suitable for _execute_transactions
         """
-        if amount == 'all':
-            return total
-        if '%' in amount:
-            return total * float(amount.strip('%')) / 100
-        return float(amount)
+        start = self._tx_offsets[block]
+        stop = self._tx_offsets[block + 1]
+        if start == stop:
+            return None
+        return int(start), int(stop)
 
     def _update_root_weight(self, current_block: int):
         """
@@ -80,11 +287,13 @@ class Subtensor:
             weight_decrease = initial_root_weight / blocks
             new_weight = max(0, initial_weight - (block * decrease))
 
+        The schedule is deterministic, so it is precomputed in __init__
+        and this just indexes the table.
+
         Args:
             current_block (int): Current block number
         """
-        weight_decrease_per_block = self.initial_root_weight / self.blocks
-        self.root_weight = max(0.0, self.initial_root_weight - (current_block * weight_decrease_per_block))
+        self.root_weight = self._root_weights[current_block]
 
     def _process_block_step(self):
         """
@@ -107,95 +316,99 @@ class Subtensor:
              account_alpha_stake += dividend_share * emission_val
 
         The emission_val is fixed at 1.0 tao per block.
-        """
-        '''
-        emit = self._calculate_emission()
-        sum_prices = sum(s.alpha_price() for s in self.subnets.values() if not s.is_root)
-        emission_val = 1
-        min_range, max_range = self.injection_range
-
-        if sum_prices < min_range or not self.balanced:
-            self.tao_supply += emission_val
-
-        for subnet in self.subnets.values():
-            if subnet.is_root:
-                continue
-
-            tao_amount = emit.get(subnet.id, 0.0) * emission_val \
-                if sum_prices < min_range or not self.balanced else 0.0
-            alpha_amount = emission_val if sum_prices > max_range and self.balanced else 0.0
-            
-            if min_range <= sum_prices <= max_range and self.balanced:
-                tao_amount = emit.get(subnet.id, 0.0) * emission_val
-                alpha_amount = emission_val
 
-            subnet.inject(tao_amount, alpha_amount, emission_val)
-
-            dividends = self._calculate_dividends(subnet.id)
-            for acc_id, div in dividends.items():
-                self.accounts[acc_id].alpha_stakes[subnet.id] = \
-                    self.accounts[acc_id].alpha_stakes.get(subnet.id, 0.0) + \
-                    div * emission_val
-
-        '''
-        emit = self._calculate_emission()
-        sum_prices = sum(s.alpha_price() for s in self.subnets.values() if not s.is_root)
-        emission_val = 1
-
-        if sum_prices < 1.0 or not self.balanced:
-            self.tao_supply += emission_val
-
-        for subnet in self.subnets.values():
-            if subnet.is_root:
-                continue
-
-            tao_amount = emit.get(subnet.id, 0.0) * emission_val \
-                if sum_prices < 1.0 or not self.balanced else 0.0
-            alpha_amount = emission_val if sum_prices >= 1.0 and self.balanced else 0.0
-
-            dividends = self._calculate_dividends(subnet.id)
-            for acc_id, div in dividends.items():
-                if subnet.id in self.accounts[acc_id].registered_subnets:
-                    self.accounts[acc_id].alpha_stakes[subnet.id] = \
-                        self.accounts[acc_id].alpha_stakes.get(subnet.id, 0.0) + \
-                        div * emission_val
-
-            subnet.inject(tao_amount, alpha_amount, emission_val)
-
-    def _execute_transaction(self, transaction: Transaction):
+        The whole step runs inside _step_kernel on the persistent pool
+        arrays, so a block touches no Python objects at all; Subnet
+        objects only see the result when a snapshot syncs them.
+        """
+        self.tao_supply += _step_kernel(
+            self.stakes, self._pool_tao_in, self._pool_alpha_in,
+            self._pool_alpha_out, self._pool_k,
+            self._registered, self._is_root_mask,
+            self.root_weight, self.global_split, self.balanced, 1.0
+        )
+        self._pools_dirty = True
+
+    def _execute_transactions(self, start: int, stop: int):
         """
-        Execute a single transaction in the simulation.
+        Execute one block's slice of the transaction arrays.
 
         For buy (stake) actions:
-            1. Parse amount from transaction.amount string
+            1. Resolve the pre-parsed amount against the free balance
             2. Convert tao_amount to alpha via subnet.stake()
             3. Add alpha_bought to account's subnet stakes
             4. Subtract tao_amount from account's free balance
 
         For sell (unstake) actions:
-            1. Parse amount from transaction.amount string
+            1. Resolve the pre-parsed amount against the current stake
             2. Convert alpha_amount to tao via subnet.unstake()
             3. Subtract alpha_amount from account's subnet stakes
             4. Add tao_bought to account's free balance
 
+        Reads only the SoA arrays built by _init_transaction_arrays and
+        applies the AMM swap math (mirroring Subnet.stake/unstake) to the
+        persistent pool arrays in place — neither Transaction nor Subnet
+        objects are touched on the hot path.
+
         Args:
-            transaction (Transaction): Transaction object containing transaction details
+            start (int): First transaction index, from transactions_at
+            stop (int): Past-the-end transaction index
         """
-        account = self.accounts.get(transaction.account_id)
-        subnet = self.subnets.get(transaction.subnet_id)
-        if not account or not subnet:
-            return
-
-        if transaction.action == 'stake':
-            tao_amount = self._parse_amount(transaction.amount, account.free_balance)
-            alpha_bought = subnet.stake(tao_amount)
-            account.alpha_stakes[transaction.subnet_id] = account.alpha_stakes.get(transaction.subnet_id, 0.0) + alpha_bought
-            account.free_balance -= tao_amount
-        elif transaction.action == 'unstake':
-            alpha_amount = self._parse_amount(transaction.amount, account.alpha_stakes.get(transaction.subnet_id, 0.0))
-            tao_bought = subnet.unstake(alpha_amount)
-            account.alpha_stakes[transaction.subnet_id] = account.alpha_stakes.get(transaction.subnet_id, 0.0) - alpha_amount
-            account.free_balance += tao_bought
+        accounts_by_row = self._accounts_by_row
+        stakes = self.stakes
+        tao_in = self._pool_tao_in
+        alpha_in = self._pool_alpha_in
+        alpha_out = self._pool_alpha_out
+        k = self._pool_k
+        is_root = self._is_root_mask
+        tx_row = self._tx_row
+        tx_col = self._tx_col
+        tx_action = self._tx_action
+        tx_kind = self._tx_kind
+        tx_val = self._tx_val
+        for i in range(start, stop):
+            row = tx_row[i]
+            col = tx_col[i]
+            if row < 0 or col < 0:
+                continue
+            action = tx_action[i]
+            kind = tx_kind[i]
+            account = accounts_by_row[row]
+            if action == Action.STAKE:
+                total = account.free_balance
+                tao_amount = (total if kind == AMOUNT_ALL else
+                              total * tx_val[i] if kind == AMOUNT_PCT else
+                              tx_val[i])
+                if is_root[col]:
+                    alpha_bought = tao_amount
+                    alpha_out[col] += tao_amount
+                else:
+                    new_tao_in = tao_in[col] + tao_amount
+                    new_alpha_in = k[col] / new_tao_in
+                    alpha_bought = alpha_in[col] - new_alpha_in
+                    alpha_out[col] += alpha_bought
+                    alpha_in[col] = new_alpha_in
+                    tao_in[col] = new_tao_in
+                stakes[row, col] += alpha_bought
+                account.free_balance -= tao_amount
+            elif action == Action.UNSTAKE:
+                total = stakes[row, col]
+                alpha_amount = (total if kind == AMOUNT_ALL else
+                                total * tx_val[i] if kind == AMOUNT_PCT else
+                                tx_val[i])
+                if is_root[col]:
+                    tao_bought = alpha_amount
+                    alpha_out[col] -= alpha_amount
+                else:
+                    new_alpha_in = alpha_in[col] + alpha_amount
+                    new_tao_in = k[col] / new_alpha_in
+                    tao_bought = tao_in[col] - new_tao_in
+                    alpha_out[col] -= alpha_amount
+                    alpha_in[col] = new_alpha_in
+                    tao_in[col] = new_tao_in
+                account.free_balance += tao_bought
+                stakes[row, col] -= alpha_amount
+        self._pools_dirty = True
 
     def _calculate_emission(self) -> Dict[int, float]:
         """
@@ -207,16 +420,22 @@ class Subtensor:
         Returns:
             Dict[int, float]: Mapping of subnet IDs to their emission shares
         """
-        emission = {s.id: s.tao_in for s in self.subnets.values() if not s.is_root}
-        total = sum(emission.values())
-        return {sid: e / total if total else 0.0 for sid, e in emission.items()}
+        if self._pools_dirty:
+            self._refresh_pool_cache()
+        total = self._tao_in_total
+        shares = self._tao_in_vec / total if total else np.zeros_like(self._tao_in_vec)
+        return {
+            int(sid): float(shares[col])
+            for col, sid in enumerate(self._col_to_sid)
+            if not self._is_root_mask[col]
+        }
 
-    def _calculate_dividends(self, subnet_id: int) -> Dict[int, float]:
+    def _calculate_all_dividends(self) -> np.ndarray:
         """
-        Calculate dividend distribution shares for accounts staked in a subnet.
+        Calculate dividend shares for every (account, subnet) pair at once.
 
-        For each account, calculates a weighted combination of:
-        1. Local weight (only for non-root subnets):
+        For each account, each share is a weighted combination of:
+        1. Local weight (per non-root subnet):
            - Calculate: (account_alpha_stake / subnet_alpha_out) * subnet_tao_in
            - Normalize: local_weight / sum(local_weights)
 
@@ -227,37 +446,41 @@ class Subtensor:
            - Normalize: global_weight_sum / sum(all_global_weights)
 
         Final dividend share formula:
-            dividend = global_split * normalized_global_weight + 
+            dividend = global_split * normalized_global_weight +
                       (1 - global_split) * normalized_local_weight
 
-        Args:
-            subnet_id (int): ID of the subnet to calculate dividends for
+        Everything is evaluated against the state at the start of the block
+        step, in one pass over the stake matrix; the old per-subnet method
+        rescanned every (subnet, account) pair for each subnet (O(S^2 * A)).
 
         Returns:
-            Dict[int, float]: Mapping of account IDs to their dividend shares,
-                             where shares sum to 1.0
+            np.ndarray: (n_accounts, n_subnets) dividend shares, where each
+                        non-root column sums to 1.0; root columns are zero
         """
-        subnet = self.subnets.get(subnet_id)
-        if not subnet:
-            return {}
-
-        weights = self._calculate_weights()
-        local_weights = {
-            acc_id: subnet.weight(account.alpha_stakes.get(subnet_id, 0.0))
-            for acc_id, account in self.accounts.items()
-            if subnet_id in account.alpha_stakes
-        }
-
-        total_local = sum(local_weights.values())
-        total_global = sum(weights.values())
-
-        return {
-            acc_id: (
-                self.global_split * (weights.get(acc_id, 0.0) / total_global if total_global else 0.0) +
-                (1 - self.global_split) * (local_weights.get(acc_id, 0.0) / total_local if total_local else 0.0)
-            )
-            for acc_id in self.accounts
-        }
+        price = self._weight_per_unit()
+        per_unit = np.where(self._is_root_mask, self.root_weight, price)
+
+        global_w = self.stakes @ per_unit
+        total_global = global_w.sum()
+        global_share = np.divide(global_w, total_global,
+                                 out=np.zeros_like(global_w),
+                                 where=total_global > 0)
+
+        local_w = self.stakes * price[None, :]
+        total_local = local_w.sum(axis=0)
+        local_share = np.divide(local_w, total_local[None, :],
+                                out=np.zeros_like(local_w),
+                                where=total_local[None, :] > 0)
+
+        dividends = (self.global_split * global_share[:, None] +
+                     (1 - self.global_split) * local_share)
+        dividends[:, self._is_root_mask] = 0.0
+        return dividends
+
+    def _dividends_to_dict(self, shares: np.ndarray) -> Dict[int, float]:
+        """Convert one dividend column to {account_id: share}, nonzero entries only"""
+        rows = np.nonzero(shares)[0]
+        return {int(self._account_ids[r]): float(shares[r]) for r in rows}
 
     def _calculate_weights(self) -> Dict[int, float]:
         """
@@ -272,40 +495,208 @@ class Subtensor:
         Total weight per account:
             account_weight = sum(stake_weights across all subnets)
 
+        Computed as a single matrix-vector product over the stake matrix:
+        each column's weight-per-unit-alpha is root_weight for the root
+        subnet and tao_in / alpha_out otherwise (0 when nothing is staked).
+
         Returns:
             Dict[int, float]: Mapping of account IDs to their global weights
         """
-        weights = defaultdict(float)
-        for subnet in self.subnets.values():
-            for acc_id, account in self.accounts.items():
-                if subnet.id in account.alpha_stakes:
-                    alpha = account.alpha_stakes[subnet.id]
-                    weight = subnet.weight(alpha * self.root_weight if subnet.is_root else alpha)
-                    weights[acc_id] += weight
-        return dict(weights)
+        per_unit = np.where(self._is_root_mask, self.root_weight,
+                            self._weight_per_unit())
+        totals = self.stakes @ per_unit
+        return dict(zip(self._account_id_list, totals.tolist()))
+
+    def _sync_pools_to_subnets(self):
+        """
+        Materialize the pool arrays back onto the Subnet objects.
+
+        The run mutates only the arrays; this is called at snapshot
+        boundaries so object-based consumers (get_state, alpha_price)
+        see current pool state.
+        """
+        tao_in = self._pool_tao_in
+        alpha_in = self._pool_alpha_in
+        alpha_out = self._pool_alpha_out
+        k = self._pool_k
+        for col, subnet in enumerate(self._subnets_by_col):
+            subnet.tao_in = tao_in[col]
+            subnet.alpha_in = alpha_in[col]
+            subnet.alpha_out = alpha_out[col]
+            subnet.k = k[col]
+
+    def _refresh_pool_cache(self):
+        """
+        Recompute pool-derived vectors and aggregates from the pool arrays.
+
+        Covers the weight-per-unit vector (tao_in / alpha_out), the tao_in
+        vector and its non-root total (emission shares), and the sum of
+        non-root alpha prices. Only runs after a transaction or block step
+        has touched the pools; in between, every caller reuses the cache.
+        """
+        tao_in = self._tao_in_vec
+        np.copyto(tao_in, self._pool_tao_in)
+        alpha_in = self._pool_alpha_in
+        alpha_out = self._pool_alpha_out
+
+        np.divide(tao_in, alpha_out, out=self._wpu_vec, where=alpha_out > 0)
+        self._wpu_vec[alpha_out == 0] = 0.0
+
+        non_root = ~self._is_root_mask
+        alpha_in_safe = np.where(alpha_in > 0, alpha_in, 1.0)
+        prices = np.where(alpha_in > 0, tao_in / alpha_in_safe, 1.0)
+        self._sum_prices = float((prices * non_root).sum())
+        self._tao_in_total = float((tao_in * non_root).sum())
+        self._pools_dirty = False
+
+    def _weight_per_unit(self) -> np.ndarray:
+        """Cached weight per unit of stake (tao_in / alpha_out) per column"""
+        if self._pools_dirty:
+            self._refresh_pool_cache()
+        return self._wpu_vec
+
+    def _sum_alpha_prices(self) -> float:
+        """Cached sum of alpha prices across non-root subnets"""
+        if self._pools_dirty:
+            self._refresh_pool_cache()
+        return self._sum_prices
+
+    def _market_values(self) -> np.ndarray:
+        """
+        Calculate market values for all accounts in one vectorized pass.
+
+        Stacks alpha stakes into an (n_accounts, n_subnets) array and
+        evaluates the unstake payout tao_in - k/(alpha_in + stake) for
+        every pair at once, using the raw stake for root subnets.
+
+        Returns:
+            np.ndarray: Market value per account, in account iteration order
+        """
+        free_balance = np.array(
+            [a.free_balance for a in self._accounts_by_row], dtype=np.float64
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _market_value_kernel(
+                self.stakes, self._pool_tao_in, self._pool_alpha_in,
+                self._pool_k, self._is_root_mask, free_balance
+            )
+
+    def get_state_columns(self, block: int) -> Dict[str, Any]:
+        """
+        Get complete state at given block as column-oriented arrays.
+
+        Returns one NumPy array per numeric column plus pre-serialized
+        JSON strings for the mapping columns, ready to be zipped into
+        storage rows without building per-entity dicts.
+
+        The numeric column buffers are allocated once and reused for every
+        logged block; the caller consumes them (build_state_rows) before
+        the next snapshot can overwrite them. Snapshots are
+        visualization-grade and stored as float32 — the in-simulation
+        arithmetic stays float64 and is only downcast here.
+        """
+        self._sync_pools_to_subnets()
+        emissions = self._calculate_emission()
+        dividends = self._calculate_all_dividends()
+        accounts = list(self.accounts.values())
+        subnets = list(self.subnets.values())
+
+        bufs = self._snapshot_bufs
+        if bufs is None:
+            bufs = self._snapshot_bufs = {
+                'account_id': np.array([a.id for a in accounts], dtype=np.int64),
+                'free_balance': np.empty(len(accounts), dtype=np.float32),
+                'subnet_id': np.array([s.id for s in subnets], dtype=np.int64),
+                'tao_in': np.empty(len(subnets), dtype=np.float32),
+                'alpha_in': np.empty(len(subnets), dtype=np.float32),
+                'alpha_out': np.empty(len(subnets), dtype=np.float32),
+                'k': np.empty(len(subnets), dtype=np.float32),
+                'exchange_rate': np.empty(len(subnets), dtype=np.float32),
+                'emission_rate': np.empty(len(subnets), dtype=np.float32),
+            }
+
+        free_balance = bufs['free_balance']
+        for i, account in enumerate(accounts):
+            free_balance[i] = account.free_balance
+
+        tao_in = bufs['tao_in']
+        alpha_in = bufs['alpha_in']
+        alpha_out = bufs['alpha_out']
+        k = bufs['k']
+        exchange_rate = bufs['exchange_rate']
+        emission_rate = bufs['emission_rate']
+        for i, subnet in enumerate(subnets):
+            tao_in[i] = subnet.tao_in
+            alpha_in[i] = subnet.alpha_in
+            alpha_out[i] = subnet.alpha_out
+            k[i] = subnet.k
+            exchange_rate[i] = subnet.alpha_price()
+            emission_rate[i] = emissions.get(subnet.id, 0.0)
+
+        accounts_state = {
+            'account_id': bufs['account_id'],
+            'free_balance': free_balance,
+            'market_value': self._market_values().astype(np.float32),
+            'alpha_stakes': [pack_id_amount_map(self._stakes_to_dict(a.alpha_stakes))
+                             for a in accounts]
+        }
+
+        subnets_state = {
+            'subnet_id': bufs['subnet_id'],
+            'tao_in': tao_in,
+            'alpha_in': alpha_in,
+            'alpha_out': alpha_out,
+            'k': k,
+            'exchange_rate': exchange_rate,
+            'emission_rate': emission_rate,
+            'dividends': [
+                pack_id_amount_map(
+                    self._dividends_to_dict(dividends[:, self._sid_to_col[s.id]])
+                )
+                for s in subnets
+            ]
+        }
+
+        network_state = {
+            'tao_supply': self.tao_supply,
+            'sum_prices': self._sum_alpha_prices()
+        }
+
+        return {
+            'block': block,
+            'accounts': accounts_state,
+            'subnets': subnets_state,
+            'network': network_state
+        }
 
     def get_state(self, block: int) -> Dict[str, Any]:
         """Get complete state at given block"""
+        self._sync_pools_to_subnets()
         emissions = self._calculate_emission()
-        
+        dividends = self._calculate_all_dividends()
+
+        market_values = self._market_values()
         accounts_state = [
-            account.get_state(self.subnets)
-            for account in self.accounts.values()
+            {
+                'account_id': account.id,
+                'free_balance': account.free_balance,
+                'market_value': market_values[i],
+                'alpha_stakes': self._stakes_to_dict(account.alpha_stakes)
+            }
+            for i, account in enumerate(self.accounts.values())
         ]
         
         subnets_state = [
             subnet.get_state(
                 emissions,
-                self._calculate_dividends(subnet.id) if not subnet.is_root else {}
+                self._dividends_to_dict(dividends[:, self._sid_to_col[subnet.id]])
             )
             for subnet in self.subnets.values()
         ]
         
         network_state = {
             'tao_supply': self.tao_supply,
-            'sum_prices': sum(s.alpha_price() 
-                for s in self.subnets.values() 
-                if not s.is_root)
+            'sum_prices': self._sum_alpha_prices()
         }
         
         return {
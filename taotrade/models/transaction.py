@@ -1,7 +1,29 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
 
+# Amount kinds, resolved once at construction so executing a transaction
+# never has to re-parse the amount string
+AMOUNT_ALL = 0
+AMOUNT_PCT = 1
+AMOUNT_ABS = 2
 
-@dataclass
+
+class Action(IntEnum):
+    """
+    Transaction action tags.
+
+    Integer-valued so the execution dispatcher compares ints instead of
+    hashing strings; the legacy 'stake'/'unstake' string literals are
+    normalized to these at construction.
+    """
+    STAKE = 1
+    UNSTAKE = 2
+
+
+_ACTION_ALIASES = {'stake': Action.STAKE, 'unstake': Action.UNSTAKE}
+
+
+@dataclass(slots=True)
 class Transaction:
     """
     Class representing a transaction in the simulation.
@@ -10,11 +32,31 @@ class Transaction:
         block (int): Block number when the transaction occurred
         account_id (int): ID of the account executing the transcation
         subnet_id (int): ID of the subnet where transaction occurred
-        action (str): Type of transaction action performed (stake/unstake)
-        amount (str): Amount of tokens involved in the transaction
+        action (Action): Transaction action performed; the legacy
+            'stake'/'unstake' strings are accepted and normalized
+        amount (str | float): Amount of tokens involved in the transaction.
+            Strings support 'all', percentages like '50%', and plain
+            numbers; numeric values are taken as absolute amounts.
     """
     block: int
     account_id: int
     subnet_id: int
-    action: str
+    action: Action
     amount: str
+    _kind: int = field(init=False, repr=False)
+    _val: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Normalize the action tag and classify the amount once at load time"""
+        # Unknown actions stay as-is and fall through the dispatcher
+        # unexecuted, as they always have
+        self.action = _ACTION_ALIASES.get(self.action, self.action)
+        amount = self.amount
+        if not isinstance(amount, str):
+            self._kind, self._val = AMOUNT_ABS, float(amount)
+        elif amount == 'all':
+            self._kind, self._val = AMOUNT_ALL, 0.0
+        elif '%' in amount:
+            self._kind, self._val = AMOUNT_PCT, float(amount.strip('%')) / 100
+        else:
+            self._kind, self._val = AMOUNT_ABS, float(amount)
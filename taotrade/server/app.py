@@ -7,6 +7,10 @@ from taotrade.core.database import Database
 from taotrade.core.engine import SimulationEngine
 from taotrade.server.graphql.types import Query, Mutation
 
+# Schema construction introspects every type via reflection; build it
+# once at import and share it across Server instances
+_SCHEMA = strawberry.Schema(query=Query, mutation=Mutation)
+
 class Server:
     def __init__(self, port: int = 8000):
         self.app = FastAPI(title="TaoTrade Server")
@@ -17,9 +21,8 @@ class Server:
         self._setup_graphql()
 
     def _setup_graphql(self):
-        schema = strawberry.Schema(query=Query, mutation=Mutation)
         graphql_app = GraphQLRouter(
-            schema,
+            _SCHEMA,
             graphql_ide="apollo-sandbox",
             allow_queries_via_get=True
         )
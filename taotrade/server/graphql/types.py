@@ -1,9 +1,25 @@
+import asyncio
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 import strawberry
 from datetime import datetime
 from taotrade.core.database import Database
 from taotrade.core.engine import SimulationEngine
 
+
+# Shared across requests: Database keeps persistent SQLite connections
+# and the engine caches loaded simulation classes. Built lazily on the
+# first resolver call so importing this module has no filesystem side
+# effects (Database.__init__ creates the database file)
+@lru_cache(maxsize=None)
+def _get_db() -> Database:
+    return Database()
+
+
+@lru_cache(maxsize=None)
+def _get_engine() -> SimulationEngine:
+    return SimulationEngine()
+
 @strawberry.type
 class SimulationAttributes:
     name: str
@@ -36,9 +52,9 @@ def convert_to_simulation(data: Dict[str, Any]) -> Simulation:
     metadata = convert_to_simulation_metadata(data.get('metadata', {}))
     
     attributes = SimulationAttributes(
-        name=str(data.get('name', '')),
-        created_at=str(data.get('created_at', datetime.now().isoformat())),
-        status=str(data.get('status', '')),
+        name=data.get('name', ''),
+        created_at=data.get('created_at', datetime.now().isoformat()),
+        status=data.get('status', ''),
         current_block=data.get('current_block'),
         progress=data.get('progress'),
         progress_percentage=data.get('progress_percentage'),
@@ -47,7 +63,7 @@ def convert_to_simulation(data: Dict[str, Any]) -> Simulation:
     )
     
     simulation_data = SimulationData(
-        id=str(data.get('id', '')),
+        id=data.get('id', ''),
         attributes=attributes
     )
     
@@ -55,23 +71,24 @@ def convert_to_simulation(data: Dict[str, Any]) -> Simulation:
 
 def convert_to_simulation_metadata(data: Dict[str, Any]) -> 'SimulationMetadata':
     return SimulationMetadata(
-        total_blocks=int(data.get('total_blocks', 0)),
-        logged_blocks=int(data.get('logged_blocks', 0)),
+        total_blocks=data.get('total_blocks', 0),
+        logged_blocks=data.get('logged_blocks', 0),
         log_interval=data.get('log_interval')
     )
 
 def convert_to_blocks_connection(data: Dict[str, Any]) -> 'BlocksConnection':
-    blocks = []
-    for block_num, block_data in sorted(data.items(), key=lambda x: int(x[0])):
-        blocks.append(convert_to_block(int(block_num), block_data))
+    blocks = [
+        convert_to_block(block_num, data[block_num])
+        for block_num in sorted(data)
+    ]
     
     return BlocksConnection(
         data=blocks,
         page_info=PageInfo(
             has_next_page=bool(blocks),
             has_previous_page=bool(blocks),
-            start_block=int(blocks[0].id if blocks else 0),
-            end_block=int(blocks[-1].id if blocks else 0),
+            start_block=blocks[0].id if blocks else 0,
+            end_block=blocks[-1].id if blocks else 0,
             total_blocks=len(blocks)
         )
     )
@@ -86,8 +103,8 @@ def convert_to_block(block_num: int, data: Dict[str, Any]) -> 'Block':
 
 def convert_to_network_state(data: Dict[str, Any]) -> 'NetworkState':
     return NetworkState(
-        tao_supply=float(data.get('tao_supply', 0.0)),
-        sum_prices=float(data.get('sum_prices', 0.0))
+        tao_supply=data.get('tao_supply', 0.0),
+        sum_prices=data.get('sum_prices', 0.0)
     )
 
 def convert_to_accounts_connection(data: List[Dict[str, Any]]) -> 'AccountsConnection':
@@ -97,15 +114,15 @@ def convert_to_accounts_connection(data: List[Dict[str, Any]]) -> 'AccountsConne
 
 def convert_to_account(data: Dict[str, Any]) -> 'Account':
     return Account(
-        id=int(data.get('account_id', 0)),
-        free_balance=float(data.get('free_balance', 0.0)),
-        market_value=float(data.get('market_value', 0.0)),
+        id=data.get('account_id', 0),
+        free_balance=data.get('free_balance', 0.0),
+        market_value=data.get('market_value', 0.0),
         alpha_stakes=convert_to_alpha_stakes_connection(data.get('alpha_stakes', {}))
     )
 
 def convert_to_alpha_stakes_connection(data: Dict[str, Any]) -> 'AlphaStakesConnection':
     stakes = [
-        AlphaStake(netuid=int(netuid), amount=float(amount))
+        AlphaStake(netuid=netuid, amount=amount)
         for netuid, amount in data.items()
     ]
     return AlphaStakesConnection(data=stakes)
@@ -117,19 +134,19 @@ def convert_to_subnets_connection(data: List[Dict[str, Any]]) -> 'SubnetsConnect
 
 def convert_to_subnet(data: Dict[str, Any]) -> 'Subnet':
     return Subnet(
-        netuid=int(data.get('subnet_id', 0)),
-        tao_in=float(data.get('tao_in', 0.0)),
-        alpha_in=float(data.get('alpha_in', 0.0)),
-        alpha_out=float(data.get('alpha_out', 0.0)),
-        k=float(data.get('k', 0.0)),
-        exchange_rate=float(data.get('exchange_rate', 0.0)),
-        emission_rate=float(data.get('emission_rate', 0.0)),
+        netuid=data.get('subnet_id', 0),
+        tao_in=data.get('tao_in', 0.0),
+        alpha_in=data.get('alpha_in', 0.0),
+        alpha_out=data.get('alpha_out', 0.0),
+        k=data.get('k', 0.0),
+        exchange_rate=data.get('exchange_rate', 0.0),
+        emission_rate=data.get('emission_rate', 0.0),
         dividends=convert_to_dividends_connection(data.get('dividends', {}))
     )
 
 def convert_to_dividends_connection(data: Dict[str, Any]) -> 'DividendsConnection':
     dividends = [
-        Dividend(id=int(id), amount=float(amount))
+        Dividend(id=id, amount=amount)
         for id, amount in data.items()
     ]
     return DividendsConnection(data=dividends)
@@ -212,27 +229,30 @@ class SimulationMetadata:
 @strawberry.type
 class Query:
     @strawberry.field
-    def simulations(self) -> List[Simulation]:
-        db = Database()
-        simulations_data = db.get_simulations()
-        return [convert_to_simulation(sim) for sim in simulations_data]
+    async def simulations(self) -> List[Simulation]:
+        # Both the DB read and the dict -> Strawberry conversion are
+        # CPU/IO-bound Python work; run them off the event loop so
+        # concurrent requests don't serialize behind them
+        simulations_data = await asyncio.to_thread(_get_db().get_simulations)
+        return list(await asyncio.gather(*[
+            asyncio.to_thread(convert_to_simulation, sim)
+            for sim in simulations_data
+        ]))
 
     @strawberry.field
-    def simulation(self, id: str) -> Optional[Simulation]:
-        db = Database()
-        simulation_data = db.get_simulation(id)
+    async def simulation(self, id: str) -> Optional[Simulation]:
+        simulation_data = await asyncio.to_thread(_get_db().get_simulation, id)
         if simulation_data:
-            return convert_to_simulation(simulation_data)
+            return await asyncio.to_thread(convert_to_simulation, simulation_data)
         return None
 
 
 @strawberry.type
 class Mutation:
     @strawberry.mutation
-    def create_simulation(self, name: str) -> SimulationResult:
+    async def create_simulation(self, name: str) -> SimulationResult:
         try:
-            engine = SimulationEngine()
-            simulation_id = engine.run_simulation(name)
+            simulation_id = await asyncio.to_thread(_get_engine().run_simulation, name)
             return SimulationResult(
                 status="success",
                 id=simulation_id,
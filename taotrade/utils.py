@@ -1,15 +1,69 @@
 import json
-from typing import Any
+from typing import Any, Dict
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Packed on-disk layout for {id: amount} mappings: one (int64 id,
+# float64 amount) pair per entry, little-endian. The id field is int64
+# because the dividends column keys on account ids, which are arbitrary
+# Python ints; the blob still beats the JSON text on size.
+_ID_AMOUNT_DTYPE = np.dtype([('id', '<i8'), ('amount', '<f8')])
+
+
+def pack_id_amount_map(data: Dict[int, float]) -> bytes:
+    """
+    Pack an {id: amount} mapping into a compact binary blob.
+
+    Used for the alpha_stakes and dividends columns, which are always
+    Dict[int, float]; the packed form needs no JSON encode/decode and is
+    roughly half the size of the JSON text.
+
+    Args:
+        data (Dict[int, float]): Mapping of IDs to amounts
+    """
+    if not data:
+        return b''
+    return np.array(list(data.items()), dtype=_ID_AMOUNT_DTYPE).tobytes()
+
+
+def unpack_id_amount_map(blob) -> Dict[int, float]:
+    """
+    Unpack a blob written by pack_id_amount_map back into a dict.
+
+    Args:
+        blob: Packed bytes, or empty/None for an empty mapping
+    """
+    if not blob:
+        return {}
+    return dict(np.frombuffer(blob, dtype=_ID_AMOUNT_DTYPE).tolist())
 
 
 def write_json(filepath: str, data: Any):
     """
     Write data to a JSON file with proper formatting.
 
+    Prefers orjson, which formats float-heavy payloads several times
+    faster than the stdlib's pure-Python indenting, serializes NumPy
+    arrays and scalars without intermediate lists, and emits bytes
+    written directly. Falls back to stdlib json otherwise.
+
     Args:
         filepath (str): Path to the output JSON file
         data (Any): Data to serialize to JSON format
     """
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 |
+                       orjson.OPT_NON_STR_KEYS
+            ))
+        return
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=4)
 
@@ -21,5 +75,8 @@ def read_json(filepath: str) -> Any:
     Args:
         filepath (str): Path to the JSON file to read
     """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
     with open(filepath, 'r') as f:
         return json.load(f)
@@ -1,9 +1,58 @@
-from rao.models.base.simulation import BaseSimulation
-from rao.models.subtensor import Subtensor
-from rao.models.subnet import Subnet
-from rao.models.account import Account
-from rao.models.transaction import Transaction
-#from rao.models.base.strategy import Strategy
+import copy
+from functools import lru_cache
+
+from taotrade.models.base.simulation import BaseSimulation
+from taotrade.models.subtensor import Subtensor
+from taotrade.models.subnet import Subnet
+from taotrade.models.account import Account
+from taotrade.models.transaction import Action, Transaction
+#from taotrade.models.base.strategy import Strategy
+
+
+@lru_cache(maxsize=1)
+def _build_template():
+    """
+    Build the scenario once, on first setup.
+
+    The scenario never changes between runs, so the constructed objects
+    are cached and setup() hands each run cheap copies of the mutable
+    pieces.
+    """
+    subnets = (
+        Subnet(id=0, tao_in=0.0, alpha_in=0.0, alpha_out=0.0, is_root=True),
+        Subnet(id=1, tao_in=1.0, alpha_in=1.0, alpha_out=0.0)
+    )
+    accounts = (
+        Account(
+            id=1,
+            free_balance=100.0,
+            registered_subnets=[0, 1],
+            strategy=None
+        ),
+        Account(
+            id=2,
+            free_balance=100.0,
+            registered_subnets=[1],
+            strategy=None
+        )
+    )
+    transactions = (
+        Transaction(
+            block=1,
+            account_id=1,
+            subnet_id=0,
+            action=Action.STAKE,
+            amount=100.0
+        ),
+        Transaction(
+            block=1,
+            account_id=2,
+            subnet_id=1,
+            action=Action.STAKE,
+            amount=100.0
+        )
+    )
+    return subnets, accounts, transactions
 
 
 class FirstBlock(BaseSimulation):
@@ -12,49 +61,17 @@ class FirstBlock(BaseSimulation):
         self.name = "first_block"
 
     def setup(self):
-        subnets = [
-            Subnet(id=0, tao_in=0.0, alpha_in=0.0, alpha_out=0.0, is_root=True),
-            Subnet(id=1, tao_in=1.0, alpha_in=1.0, alpha_out=0.0)
-        ]
-
-        accounts = [
-            Account(
-                id=1,
-                free_balance=100.0,
-                registered_subnets=[0, 1],
-                alpha_stakes={},
-                strategy=None
-            ),
-            Account(
-                id=2,
-                free_balance=100.0,
-                registered_subnets=[1],
-                alpha_stakes={},
-                strategy=None
-            ),
-        ]
-
-        transactions = [
-            Transaction(
-                block=1,
-                account_id=1,
-                subnet_id=0,
-                action='stake',
-                amount='100'
-            ),
-            Transaction(
-                block=1,
-                account_id=2,
-                subnet_id=1,
-                action='stake',
-                amount='100'
-            )
-        ]
+        template_subnets, template_accounts, template_transactions = _build_template()
+        # Shallow copies suffice: a run only mutates scalar fields (pool
+        # state, balances), while the config containers are read-only.
+        # Transactions are never mutated at all and are shared by reference
+        subnets = [copy.copy(subnet) for subnet in template_subnets]
+        accounts = [copy.copy(account) for account in template_accounts]
 
         self.subtensor = Subtensor(
             subnets=subnets,
             accounts=accounts,
-            transactions=transactions,
+            transactions=list(template_transactions),
             tao_supply=200,
             global_split=1.0,
             balanced=True,